@@ -262,6 +262,14 @@ class EventQueue(object):
         else:
             self.queue.append(event)
 
+    def push_many(self, events):
+        # type: (Iterable[Dict[str, Any]]) -> None
+        # Virtual events are collapsed incrementally by push, so
+        # pushing a batch is just pushing each event in order.
+        push = self.push
+        for event in events:
+            push(event)
+
     # Note that pop ignores virtual events.  This is fine in our
     # current usage since virtual events should always be resolved to
     # a real event before being given to users.
@@ -218,7 +218,12 @@ class POSTRequestMock(object):
 
     def __init__(self, post_data, user_profile, assert_callback=None):
         # type: (Dict[str, Any], UserProfile, Optional[Callable]) -> None
-        self.REQUEST = self.POST = post_data
+        # Values that aren't already strings are JSON-encoded, the
+        # way a real client would send them, so callers can pass
+        # e.g. True or ["message"] directly.
+        self.REQUEST = self.POST = dict(
+            (key, value if isinstance(value, six.string_types) else ujson.dumps(value))
+            for (key, value) in post_data.items())
         self.user = user_profile
         self._tornado_handler = DummyHandler(assert_callback)
         self.session = DummySession()